@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Exercise the HTTP interactions endpoint locally, without Discord.
+
+Starts the interactions server with a throwaway signing key and a fake Discord
+API that records webhook calls, then sends signed interactions to it and
+prints the replies.
+
+Usage: dev-tools/fake-interactions.py CONFIG COMMAND [OPTION=VALUE ...] [--guild-id ID] [--user-id ID]
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import aiohttp
+from aiohttp import web
+from nacl.signing import SigningKey
+
+from minecord.config import Config
+from minecord.interactions import InteractionsServer
+
+SERVER_PORT = 8765
+FAKE_API_PORT = 8766
+
+
+class FakeDiscordApi:
+    """Records webhook messages and answers user lookups."""
+
+    def __init__(self):
+        self.messages = []
+        self.received = asyncio.Event()
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_patch("/webhooks/{app_id}/{token}/messages/@original", self.record)
+        app.router.add_post("/webhooks/{app_id}/{token}", self.record)
+        app.router.add_get("/users/{user_id}", self.user)
+        return app
+
+    async def record(self, request: web.Request) -> web.Response:
+        self.messages.append((request.method, await request.json()))
+        self.received.set()
+        return web.json_response({})
+
+    async def user(self, request: web.Request) -> web.Response:
+        user_id = request.match_info["user_id"]
+        return web.json_response({"id": user_id, "username": f"user{user_id}"})
+
+
+class FakeInteractionsClient:
+    """Signs and sends interactions the way Discord does."""
+
+    def __init__(self, session: aiohttp.ClientSession, signing_key: SigningKey, url: str):
+        self.session = session
+        self.signing_key = signing_key
+        self.url = url
+
+    async def send(self, payload: dict):
+        body = json.dumps(payload).encode()
+        timestamp = str(int(time.time()))
+        signature = self.signing_key.sign(timestamp.encode() + body).signature.hex()
+        headers = {
+            "Content-Type": "application/json",
+            "X-Signature-Ed25519": signature,
+            "X-Signature-Timestamp": timestamp,
+        }
+        async with self.session.post(self.url, data=body, headers=headers) as response:
+            return response.status, await response.text()
+
+
+async def main(args):
+    signing_key = SigningKey.generate()
+    fake_api = FakeDiscordApi()
+    server = InteractionsServer(
+        Config(args.config),
+        public_key=signing_key.verify_key.encode().hex(),
+        api_base=f"http://127.0.0.1:{FAKE_API_PORT}",
+    )
+
+    runners = []
+    for app, port in ((fake_api.create_app(), FAKE_API_PORT), (server.create_app(), SERVER_PORT)):
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", port).start()
+        runners.append(runner)
+
+    try:
+        async with aiohttp.ClientSession() as session:
+            client = FakeInteractionsClient(session, signing_key, f"http://127.0.0.1:{SERVER_PORT}/interactions")
+
+            print("PING ->", await client.send({"id": "1", "token": "ping", "type": 1}))
+
+            options = [dict(zip(("name", "value"), option.split("=", 1))) for option in args.options]
+            payload = {
+                "id": "2",
+                "token": "fake-token",
+                "type": 2,
+                "guild_id": str(args.guild_id) if args.guild_id else None,
+                "member": {"user": {"id": str(args.user_id), "username": "tester"}},
+                "data": {"name": args.command, "options": options},
+            }
+            print(f"{args.command} ->", await client.send(payload))
+
+            await asyncio.wait_for(fake_api.received.wait(), timeout=args.timeout)
+            # Give any followups a moment to arrive.
+            await asyncio.sleep(0.5)
+            for method, message in fake_api.messages:
+                print(f"webhook {method}: {message}")
+    finally:
+        for runner in reversed(runners):
+            await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Send fake Discord interactions to the Minecord HTTP endpoint.")
+    parser.add_argument("config", help="Path to configuration file (YAML format)")
+    parser.add_argument("command", help="Slash command name, e.g. online")
+    parser.add_argument("options", nargs="*", help="Command options as NAME=VALUE")
+    parser.add_argument("--guild-id", type=int, help="Guild ID to send the interaction from")
+    parser.add_argument("--user-id", type=int, default=1, help="User ID sending the interaction")
+    parser.add_argument("--timeout", type=float, default=10, help="Seconds to wait for a reply")
+    asyncio.run(main(parser.parse_args()))
@@ -42,7 +42,20 @@ class Admins:
         return False
     
 
+    def _file_stamp(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _reload_if_changed(self):
+        # Other bot processes may share this file, so pick up their changes before using it.
+        if self._file_stamp() != self._stamp:
+            self._load()
+
     def _load(self) -> List[str]:
+        self._stamp = self._file_stamp()
         if not os.path.exists(self.path):
             self.admins = {}
         else:
@@ -55,12 +68,15 @@ class Admins:
         return self.admins
     
     def is_admin(self, user_id: str) -> bool:
+        self._reload_if_changed()
         return user_id in self.admins
     
     def can_add_admin(self, user_id: str ) -> bool:
+        self._reload_if_changed()
         return self.admins.get(user_id, {}).get(KEY_ROLE, '') == ROLE_ROOT
 
     def add_admin(self, user_id: str, user_name: str) -> bool:
+        self._reload_if_changed()
         if not user_id in self.admins:
             self.admins[user_id] = { KEY_DISPLAY_NAME: user_name, KEY_ROLE: ROLE_DELEGATE }
             self._store()
@@ -68,5 +84,6 @@ class Admins:
     def _store(self):
         with open(self.path, 'w') as file:
             file.write(yaml.dump(self.admins, indent=2))
+        self._stamp = self._file_stamp()
 
     
\ No newline at end of file
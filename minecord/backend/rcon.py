@@ -1,9 +1,47 @@
 import os
 import re
+import socket
 from typing import List, Optional
 
 from mcrcon import MCRcon, MCRconException
 
+RCON_TIMEOUT = 5
+
+
+class _SocketTimeoutMCRcon(MCRcon):
+    """
+    MCRcon that enforces its timeout with socket timeouts instead of SIGALRM.
+
+    mcrcon installs a SIGALRM handler, which only works in the main thread;
+    this variant can run in a worker thread so commands don't block the event loop.
+    """
+
+    def __init__(self, host: str, password: str, port: int = 25575, timeout: int = RCON_TIMEOUT):
+        self.host = host
+        self.password = password
+        self.port = port
+        self.tlsmode = 0
+        self.timeout = timeout
+
+    def connect(self):
+        try:
+            self.socket = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        except socket.timeout:
+            raise MCRconException("Connection timeout error")
+        self._send(3, self.password)
+
+    def _read(self, length: int) -> bytes:
+        data = b""
+        while len(data) < length:
+            try:
+                chunk = self.socket.recv(length - len(data))
+            except socket.timeout:
+                raise MCRconException("Connection timeout error")
+            if not chunk:
+                raise MCRconException("Connection closed by server")
+            data += chunk
+        return data
+
 
 class MinecraftRCONClient:
     """
@@ -34,7 +72,7 @@ class MinecraftRCONClient:
     def _execute_command(self, command: str) -> str:
         """Establishes a connection and executes a single command."""
         try:
-            with MCRcon(self.host, self.password, self.port) as mcr:
+            with _SocketTimeoutMCRcon(self.host, self.password, self.port) as mcr:
                 response = mcr.command(command)
                 return response
         except MCRconException as e:
@@ -1,6 +1,6 @@
 import os
 import discord
-from discord.ext.commands import Bot
+from discord.ext.commands import AutoShardedBot
 from discord import TextChannel, app_commands
 from discord import Interaction, Intents, Forbidden, HTTPException
 import argparse
@@ -9,23 +9,31 @@ import argparse
 from .config import Config, create_example_config
 from .cogs.minecraft import MinecraftCog
 from .cogs.admin import AdminCog
-from .admins import Admins
+from .tenants import TenantRegistry
+from .interactions import run_interactions_server
+from typing import List, Optional
 
 
-class MinecordBot(Bot):
+class MinecordBot(AutoShardedBot):
     """
     A refactored version of the bot that handles command registration
     and syncing within the class using modern discord.py practices.
+
+    The bot is sharded so that one deployment can serve many guilds, optionally
+    split across processes via shard_count/shard_ids. Each guild is served by
+    its own tenant (Minecraft server, admin list, announcement channel).
     """
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, shard_count: Optional[int] = None, shard_ids: Optional[List[int]] = None):
         # Intents.all() is powerful; for a production bot, you might want to
         # specify only the intents you truly need.
-        super().__init__(command_prefix="/", intents=Intents.all())
-        self.startup_channel_id=config.minecord_channel_id
-        self.guild_id=config.guild_id
+        shard_count = shard_count or config.shard_count
+        shard_ids = shard_ids or config.shard_ids
+        if shard_ids and not shard_count:
+            raise ValueError("shard_count is required when shard_ids is set")
+        super().__init__(command_prefix="/", intents=Intents.all(), shard_count=shard_count, shard_ids=shard_ids)
+        self.guild_id=None if config.multi_tenant else config.guild_id
         self.config = config
-        self.admins = Admins(config.admins_yaml)
-    
+        self.tenants = TenantRegistry.from_config(config)
 
     async def setup_hook(self) -> None:
         """
@@ -56,16 +64,24 @@ class MinecordBot(Bot):
         print(f"Logged in as {self.user} (ID: {self.user.id})")
         print("------")
 
-        # Send a startup message if a channel is configured.
-        if self.startup_channel_id:
+        # Send a startup message to each tenant's announcement channel, if configured.
+        for tenant_config in self.config.tenants.values():
+            channel_id = tenant_config.announcement_channel_id
+            if not channel_id:
+                continue
+
+            # Guilds handled by shards in other processes are announced there.
+            if tenant_config.guild_id is not None and self.get_guild(tenant_config.guild_id) is None:
+                continue
+
             try:
-                channel = self.get_channel(self.startup_channel_id)
+                channel = self.get_channel(channel_id)
                 if channel and isinstance(channel, TextChannel):
                     await channel.send("Hello! The Minecord bot is now online.")
                 else:
-                    print(f"Warning: Could not find channel with ID {self.startup_channel_id}.")
+                    print(f"Warning: Could not find channel with ID {channel_id}.")
             except (ValueError, Forbidden, HTTPException) as e:
-                print(f"Error sending startup message to channel {self.startup_channel_id}: {e}")
+                print(f"Error sending startup message to channel {channel_id}: {e}")
 
 # --- Command Definition ---
 # By defining the command outside the class but attaching it to an instance,
@@ -90,6 +106,10 @@ def run_bot():
     )
     parser.add_argument("--config", type=str, help="Path to configuration file (YAML format)")
     parser.add_argument("--print-sample-config", action="store_true", help="Print a sample configuration file and exit")
+    parser.add_argument("--shard-count", type=int, help="Total number of shards across all processes (overrides shard_count)")
+    parser.add_argument("--shard-ids", type=int, nargs="+", help="Shard IDs to run in this process (overrides shard_ids)")
+    parser.add_argument("--http", action="store_true", help="Serve interactions over an HTTP endpoint instead of the gateway")
+    parser.add_argument("--sync-commands", action="store_true", help="With --http, register slash commands with Discord at startup")
     args = parser.parse_args()
 
     if args.print_sample_config:
@@ -104,8 +124,20 @@ def run_bot():
         print("  python -m minecord.bot --help")
         exit(1)
 
+    if args.http:
+        try:
+            run_interactions_server(config, sync_commands=args.sync_commands)
+        except ValueError as e:
+            print(f"Configuration error: {e}")
+            exit(1)
+        return
+
     # Create the bot instance
-    bot = MinecordBot(config)
+    try:
+        bot = MinecordBot(config, shard_count=args.shard_count, shard_ids=args.shard_ids)
+    except ValueError as e:
+        print(f"Configuration error: {e}")
+        exit(1)
 
     # Run the bot with the token from your config
     bot.run(config.discord_token)
@@ -18,7 +18,6 @@ class AdminCog(commands.Cog):
             bot: The bot instance.
         """
         self.bot = bot
-        self.admins = bot.admins
 
     @app_commands.command(name=MAKE_ADMIN_COMMAND, description="Add user to admins list.")
     async def make_admin(self, interaction: Interaction, user_mention: str):
@@ -29,12 +28,16 @@ class AdminCog(commands.Cog):
             print(f"Looking up user: {user_mention}")
             user = await self.bot.fetch_user(int(user_mention[2:-1]))
             print(f"Got: {user}")
-            if await self.admins.check_authorization(interaction, MAKE_ADMIN_COMMAND):
-                if not self.admins.can_add_admin(interaction.user.id):
+            tenant = await self.bot.tenants.for_interaction(interaction)
+            if tenant is None:
+                return
+
+            if await tenant.admins.check_authorization(interaction, MAKE_ADMIN_COMMAND):
+                if not tenant.admins.can_add_admin(interaction.user.id):
                     print(f"DENIED: {MAKE_ADMIN_COMMAND} was denied to user: {interaction.user.display_name} ({interaction.user.id})")
                     await interaction.response.send_message("You are not authorized to make new admins. Your attempt has been logged.", ephemeral=True)
                 else:
-                    self.admins.add_admin(user.id, user.display_name)
+                    tenant.admins.add_admin(user.id, user.display_name)
                     await interaction.response.send_message(f"{user.display_name} is now an admin on Discord (not a Minecraft op)! 🎉", ephemeral=True)
 
         except Exception:
@@ -48,7 +51,11 @@ class AdminCog(commands.Cog):
     async def am_i_admin(self, interaction: Interaction):
         try:
             print("checking")
-            if await self.admins.check_authorization(interaction, "am-i-admin"):
+            tenant = await self.bot.tenants.for_interaction(interaction)
+            if tenant is None:
+                return
+
+            if await tenant.admins.check_authorization(interaction, "am-i-admin"):
                 await interaction.response.send_message("You **are** an admin (here on Discord)! 🎉", ephemeral=True)
             print("returned")
         except Exception as e:
@@ -1,7 +1,7 @@
+import asyncio
 import discord
 from discord import app_commands, Interaction
 from discord.ext import commands
-from minecord.backend.rcon import MinecraftRCONClient
 from minecord.config import Config
 
 class MinecraftCog(commands.Cog):
@@ -15,8 +15,6 @@ class MinecraftCog(commands.Cog):
             bot: The bot instance.
         """
         self.bot = bot
-        self.minecraft = MinecraftRCONClient(bot.config.rcon_host, bot.config.rcon_port, bot.config.rcon_password)
-        self.admins = bot.admins
 
     @app_commands.command(name="online", description="List online players.")
     async def online(self, interaction: Interaction):
@@ -25,7 +23,11 @@ class MinecraftCog(commands.Cog):
         Handles connection errors gracefully.
         """
         try:
-            online_players = self.minecraft.list_players()
+            tenant = await self.bot.tenants.for_interaction(interaction)
+            if tenant is None:
+                return
+
+            online_players = await asyncio.to_thread(tenant.minecraft.list_players)
 
             if not online_players:
                 message = "No players are currently online."
@@ -49,7 +51,11 @@ class MinecraftCog(commands.Cog):
         Handles connection errors gracefully.
         """
         try:
-            fingerprint = self.minecraft.get_fingerprint()
+            tenant = await self.bot.tenants.for_interaction(interaction)
+            if tenant is None:
+                return
+
+            fingerprint = await asyncio.to_thread(tenant.minecraft.get_fingerprint)
 
             message = f"**Automodpack fingerprint:** ```{fingerprint}```"
             await interaction.response.send_message(message, ephemeral=True)
@@ -68,8 +74,12 @@ class MinecraftCog(commands.Cog):
         Requires administrator authorization.
         """
         try:
-            if await self.admins.check_authorization(interaction, "allow"):
-                response = self.minecraft.whitelist_add(username)
+            tenant = await self.bot.tenants.for_interaction(interaction)
+            if tenant is None:
+                return
+
+            if await tenant.admins.check_authorization(interaction, "allow"):
+                response = await asyncio.to_thread(tenant.minecraft.whitelist_add, username)
                 
                 # Check if the response indicates success or failure
                 if "Failed to add" in response:
@@ -95,8 +105,12 @@ class MinecraftCog(commands.Cog):
         Requires administrator authorization.
         """
         try:
-            if await self.admins.check_authorization(interaction, "list_allowed"):
-                response = self.minecraft.whitelist_list()
+            tenant = await self.bot.tenants.for_interaction(interaction)
+            if tenant is None:
+                return
+
+            if await tenant.admins.check_authorization(interaction, "list_allowed"):
+                response = await asyncio.to_thread(tenant.minecraft.whitelist_list)
                 
                 # Check if the response indicates success or failure
                 if "Failed to retrieve" in response:
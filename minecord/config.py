@@ -1,11 +1,87 @@
 import os
 import yaml
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 
 DEFAULT_ADMINS_YAML = os.path.join(os.getcwd(), "admins.yaml")
 
+DEFAULT_TENANT_CACHE_SIZE = 128
+DEFAULT_TENANT_IDLE_SECONDS = 1800
+
+DEFAULT_HTTP_HOST = "0.0.0.0"
+DEFAULT_HTTP_PORT = 8080
+
+
+def _as_int(key: str, value: Any, default: Optional[int] = None) -> Optional[int]:
+    """Convert a configuration value to an integer, warning and falling back to default on failure."""
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        fallback = "Ignoring." if default is None else f"Using default {default}."
+        print(f"Warning: {key} ('{value}') is not a valid integer. {fallback}")
+        return default
+
+
+class TenantConfig:
+    """
+    Settings for a single Discord guild (tenant) served by the bot.
+
+    Each tenant maps a guild to its own Minecraft server, admin list and
+    announcement channel.
+    """
+
+    def __init__(self, guild_id: Optional[int], data: Dict[str, Any]):
+        """
+        Initialize tenant configuration.
+
+        Args:
+            guild_id: The Discord guild ID, or None for the legacy single-tenant setup.
+            data: The tenant's configuration values.
+        """
+        self.guild_id = guild_id
+        self.data = data
+
+    @property
+    def admins_yaml(self) -> str:
+        """
+        Get the admins YAML file path for this tenant.
+
+        Guild tenants without an explicit path get their own admins-<guild_id>.yaml
+        so that admin lists are never shared between guilds.
+        """
+        admins_yaml = self.data.get("admins_yaml")
+        if admins_yaml:
+            return admins_yaml
+        if self.guild_id is None:
+            return DEFAULT_ADMINS_YAML
+        return os.path.join(os.path.dirname(DEFAULT_ADMINS_YAML), f"admins-{self.guild_id}.yaml")
+
+    @property
+    def announcement_channel_id(self) -> Optional[int]:
+        """Get the announcement (startup) channel ID, if configured."""
+        return _as_int(
+            "announcement_channel_id",
+            self.data.get("announcement_channel_id", self.data.get("minecord_channel_id")),
+        )
+
+    @property
+    def rcon_host(self) -> str:
+        """Get the RCON host."""
+        return self.data.get("rcon_host", "localhost")
+
+    @property
+    def rcon_port(self) -> int:
+        """Get the RCON port."""
+        return _as_int("rcon_port", self.data.get("rcon_port", 25575), 25575)
+
+    @property
+    def rcon_password(self) -> Optional[str]:
+        """Get the RCON password."""
+        return self.data.get("rcon_password")
+
 
 class Config:
     """
@@ -88,11 +164,6 @@ class Config:
             raise ValueError(f"Required configuration key '{key}' not found")
         return value
 
-    @property
-    def admins_yaml(self) -> str:
-        """Get the admins YAML file path."""
-        return self.get("admins_yaml") or DEFAULT_ADMINS_YAML
-
     @property
     def discord_token(self) -> str:
         """Get the Discord bot token."""
@@ -101,52 +172,90 @@ class Config:
     @property
     def guild_id(self) -> Optional[int]:
         """Get the Discord server ID, if configured."""
-        guild_id = self.get("discord_guild_id")
-        if guild_id is not None:
-            try:
-                return int(guild_id)
-            except (ValueError, TypeError):
-                print(
-                    f"Warning: minecord_channel_id ('{guild_id}') is not a valid integer. Ignoring."
-                )
-                return None
-        return None
+        return _as_int("discord_guild_id", self.get("discord_guild_id"))
 
     @property
-    def minecord_channel_id(self) -> Optional[int]:
-        """Get the startup channel ID, if configured."""
-        channel_id = self.get("minecord_channel_id")
-        if channel_id is not None:
-            try:
-                return int(channel_id)
-            except (ValueError, TypeError):
-                print(
-                    f"Warning: minecord_channel_id ('{channel_id}') is not a valid integer. Ignoring."
-                )
-                return None
-        return None
+    def discord_application_id(self) -> int:
+        """Get the Discord application ID (required for the HTTP interactions endpoint)."""
+        app_id = _as_int("discord_application_id", self.get_required("discord_application_id"))
+        if app_id is None:
+            raise ValueError("Configuration key 'discord_application_id' must be an integer")
+        return app_id
 
     @property
-    def rcon_host(self) -> str:
-        """Get the RCON host."""
-        return self.get("rcon_host", "localhost")
+    def discord_public_key(self) -> str:
+        """Get the Discord application public key used to verify interaction signatures."""
+        return self.get_required("discord_public_key")
 
     @property
-    def rcon_port(self) -> int:
-        """Get the RCON port."""
-        port = self.get("rcon_port", 25575)
+    def http_host(self) -> str:
+        """Get the address the HTTP interactions endpoint listens on."""
+        return self.get("http_host", DEFAULT_HTTP_HOST)
+
+    @property
+    def http_port(self) -> int:
+        """Get the port the HTTP interactions endpoint listens on."""
+        return _as_int("http_port", self.get("http_port", DEFAULT_HTTP_PORT), DEFAULT_HTTP_PORT)
+
+    @property
+    def shard_count(self) -> Optional[int]:
+        """Get the total number of shards, if configured. None lets Discord decide."""
+        return _as_int("shard_count", self.get("shard_count"))
+
+    @property
+    def shard_ids(self) -> Optional[List[int]]:
+        """Get the shard IDs this process should run, if configured. None runs all shards."""
+        shard_ids = self.get("shard_ids")
+        if shard_ids is None:
+            return None
         try:
-            return int(port)
+            return [int(shard_id) for shard_id in shard_ids]
         except (ValueError, TypeError):
-            print(
-                f"Warning: rcon_port ('{port}') is not a valid integer. Using default 25575."
-            )
-            return 25575
+            print(f"Warning: shard_ids ('{shard_ids}') is not a list of integers. Ignoring.")
+            return None
 
     @property
-    def rcon_password(self) -> Optional[str]:
-        """Get the RCON password."""
-        return self.get("rcon_password")
+    def multi_tenant(self) -> bool:
+        """Whether a per-guild tenants table is configured."""
+        return bool(self.get("tenants"))
+
+    @property
+    def tenants(self) -> Dict[Optional[int], TenantConfig]:
+        """
+        Get the per-guild tenant table, keyed by guild ID.
+
+        Without a 'tenants' section the top-level RCON/admin settings form a
+        single tenant under the key None, which serves every guild.
+        """
+        tenants_data = self.get("tenants")
+        if not tenants_data:
+            return {None: TenantConfig(None, self.config_data)}
+
+        if not isinstance(tenants_data, dict):
+            raise ValueError("Configuration key 'tenants' must map guild IDs to tenant settings")
+
+        tenants = {}
+        for guild_id, data in tenants_data.items():
+            try:
+                tenant_guild_id = int(guild_id)
+            except (ValueError, TypeError):
+                raise ValueError(f"Tenant guild ID '{guild_id}' is not a valid integer")
+            if data is None:
+                data = {}
+            if not isinstance(data, dict):
+                raise ValueError(f"Tenant {guild_id} settings must be a mapping")
+            tenants[tenant_guild_id] = TenantConfig(tenant_guild_id, data)
+        return tenants
+
+    @property
+    def tenant_cache_size(self) -> int:
+        """Get the maximum number of tenants kept loaded at once."""
+        return _as_int("tenant_cache_size", self.get("tenant_cache_size"), DEFAULT_TENANT_CACHE_SIZE)
+
+    @property
+    def tenant_idle_seconds(self) -> int:
+        """Get the number of idle seconds after which a loaded tenant is evicted."""
+        return _as_int("tenant_idle_seconds", self.get("tenant_idle_seconds"), DEFAULT_TENANT_IDLE_SECONDS)
 
 
 def create_example_config() -> str:
@@ -165,4 +274,26 @@ minecord_channel_id: 123456789012345678  # Optional: Channel ID for startup mess
 rcon_host: "localhost"      # Minecraft server hostname
 rcon_port: 25575           # RCON port (default: 25575)
 rcon_password: "your_rcon_password_here"  # RCON password
+
+# Sharding (optional): split the bot's shards across several processes.
+# shard_count: 4             # Total shards across all processes
+# shard_ids: [0, 1]          # Shards run by this process
+
+# Multi-guild tenancy (optional): when present, replaces the top-level
+# RCON/admin settings above with one entry per Discord guild.
+# tenants:
+#   123456789012345678:
+#     admins_yaml: "/path/to/guild-a-admins.yaml"
+#     announcement_channel_id: 123456789012345678
+#     rcon_host: "mc.guild-a.example"
+#     rcon_port: 25575
+#     rcon_password: "guild_a_rcon_password"
+# tenant_cache_size: 128     # Max tenants kept loaded per process
+# tenant_idle_seconds: 1800  # Evict tenants idle longer than this
+
+# HTTP interactions endpoint (optional): used when running with --http
+# discord_application_id: 123456789012345678
+# discord_public_key: "your_application_public_key_here"
+# http_host: "0.0.0.0"
+# http_port: 8080
 """
@@ -0,0 +1,288 @@
+import asyncio
+import json
+import time
+import traceback
+from typing import Any, Dict, List, Optional, Set
+
+import aiohttp
+from aiohttp import web
+from nacl.exceptions import BadSignatureError
+from nacl.signing import VerifyKey
+
+from .config import Config
+from .cogs.minecraft import MinecraftCog
+from .cogs.admin import AdminCog
+from .tenants import TenantRegistry
+
+DISCORD_API = "https://discord.com/api/v10"
+
+# Interaction types
+PING = 1
+APPLICATION_COMMAND = 2
+
+# Interaction callback types
+PONG = 1
+DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE = 5
+
+EPHEMERAL = 1 << 6
+
+# Signed requests older (or further in the future) than this are rejected as replays.
+MAX_TIMESTAMP_AGE = 300
+
+# Longest rate-limit wait honoured before the single retry of a webhook/API request.
+MAX_RETRY_AFTER = 30
+
+
+class HttpUser:
+    """The subset of a discord.py User/Member that the cogs use."""
+
+    def __init__(self, data: Dict[str, Any], nick: Optional[str] = None):
+        self.id = int(data["id"])
+        self.name = data.get("username", "")
+        self.display_name = nick or data.get("global_name") or self.name
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class HttpResponse:
+    """
+    Stands in for discord.py's InteractionResponse.
+
+    The interaction has already been deferred, so the first message edits the
+    deferred response and any later ones are sent as followups.
+    """
+
+    def __init__(self, server: "InteractionsServer", token: str):
+        self._server = server
+        self._token = token
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def send_message(self, content: Optional[str] = None, ephemeral: bool = False):
+        if not self._done:
+            await self._server.edit_original(self._token, content)
+            self._done = True
+        else:
+            await self._server.send_followup(self._token, content, ephemeral)
+
+
+class HttpInteraction:
+    """Stands in for discord.py's Interaction when commands arrive over HTTP."""
+
+    def __init__(self, server: "InteractionsServer", payload: Dict[str, Any]):
+        self.id = int(payload["id"])
+        self.token = payload["token"]
+        self.data = payload.get("data", {})
+        self.guild_id = int(payload["guild_id"]) if payload.get("guild_id") else None
+        self.channel_id = int(payload["channel_id"]) if payload.get("channel_id") else None
+
+        member = payload.get("member")
+        if member:
+            self.user = HttpUser(member["user"], member.get("nick"))
+        else:
+            self.user = HttpUser(payload["user"])
+
+        self.response = HttpResponse(server, self.token)
+
+
+class InteractionsBot:
+    """
+    The bot that the cogs see in HTTP mode.
+
+    It carries the same config/tenants/fetch_user surface as MinecordBot, with
+    no gateway connection behind it.
+    """
+
+    def __init__(self, config: Config, server: "InteractionsServer"):
+        self.config = config
+        self.tenants = TenantRegistry.from_config(config)
+        self._server = server
+
+    async def fetch_user(self, user_id: int) -> HttpUser:
+        return HttpUser(await self._server.api_request("GET", f"/users/{user_id}", auth=True))
+
+
+class InteractionsServer:
+    """
+    Receives Discord interactions over HTTP instead of the gateway.
+
+    Requests are verified against the application's Ed25519 public key, answered
+    immediately with a deferred (ephemeral) response, and then dispatched to the
+    MinecraftCog/AdminCog commands. Command output is delivered through the
+    interaction webhook, so workers hold no gateway state and can be scaled
+    horizontally behind a load balancer.
+    """
+
+    def __init__(self, config: Config, public_key: Optional[str] = None, api_base: str = DISCORD_API):
+        """
+        Initializes the server.
+
+        Args:
+            config: Bot configuration.
+            public_key: Hex-encoded Ed25519 public key. Defaults to discord_public_key from the config.
+            api_base: Base URL of the Discord API (overridable for local testing).
+        """
+        self.config = config
+        self.application_id = config.discord_application_id
+        self.verify_key = VerifyKey(bytes.fromhex(public_key or config.discord_public_key))
+        self.api_base = api_base.rstrip("/")
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+        self.bot = InteractionsBot(config, self)
+        self.cogs = [MinecraftCog(self.bot), AdminCog(self.bot)]
+        self.commands = {}
+        for cog in self.cogs:
+            for command in cog.get_app_commands():
+                self.commands[command.name] = (cog, command)
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/interactions", self.handle_interaction)
+        app.on_startup.append(self._on_startup)
+        app.on_cleanup.append(self._on_cleanup)
+        return app
+
+    async def _on_startup(self, app: web.Application):
+        self.session = aiohttp.ClientSession()
+
+    async def _on_cleanup(self, app: web.Application):
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.session.close()
+
+    def verify(self, signature: str, timestamp: str, body: bytes) -> bool:
+        """Check the Ed25519 signature Discord attaches to each interaction request, and that it is recent."""
+        try:
+            if abs(time.time() - int(timestamp)) > MAX_TIMESTAMP_AGE:
+                return False
+            self.verify_key.verify(timestamp.encode() + body, bytes.fromhex(signature))
+            return True
+        except (BadSignatureError, ValueError):
+            return False
+
+    async def handle_interaction(self, request: web.Request) -> web.Response:
+        body = await request.read()
+        signature = request.headers.get("X-Signature-Ed25519", "")
+        timestamp = request.headers.get("X-Signature-Timestamp", "")
+        if not self.verify(signature, timestamp, body):
+            return web.Response(status=401, text="invalid request signature")
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return web.Response(status=400, text="invalid JSON body")
+        if not isinstance(payload, dict):
+            return web.Response(status=400, text="invalid interaction payload")
+
+        if payload.get("type") == PING:
+            return web.json_response({"type": PONG})
+
+        if payload.get("type") != APPLICATION_COMMAND:
+            return web.Response(status=400, text="unsupported interaction type")
+
+        if not isinstance(payload.get("data"), dict) or not isinstance(payload.get("token"), str):
+            return web.Response(status=400, text="invalid interaction payload")
+
+        name = payload["data"].get("name")
+        if name not in self.commands:
+            print(f"Received unknown command: {name}")
+            return web.Response(status=400, text="unknown command")
+
+        # Send the deferral before dispatching, so Discord has it before the
+        # command edits the original response.
+        response = web.json_response({"type": DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE, "data": {"flags": EPHEMERAL}})
+        await response.prepare(request)
+        await response.write_eof()
+
+        task = asyncio.create_task(self._dispatch(payload))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        return response
+
+    async def _dispatch(self, payload: Dict[str, Any]):
+        interaction = None
+        try:
+            interaction = HttpInteraction(self, payload)
+            cog, command = self.commands[interaction.data["name"]]
+            options = {option["name"]: option["value"] for option in interaction.data.get("options", [])}
+
+            print(f"Dispatching {command.name} for {interaction.user.display_name} ({interaction.user.id})")
+            await command.callback(cog, interaction, **options)
+        except Exception:
+            print(traceback.format_exc())
+            # The interaction was already deferred, so always resolve it rather than leave it "thinking".
+            if interaction is None or not interaction.response.is_done():
+                try:
+                    await self.edit_original(payload["token"], "An error occurred while handling this command.")
+                except Exception:
+                    print(traceback.format_exc())
+
+    async def api_request(self, method: str, path: str, data: Any = None, auth: bool = False) -> Any:
+        headers = {}
+        if auth:
+            headers["Authorization"] = f"Bot {self.config.discord_token}"
+
+        for attempt in range(2):
+            async with self.session.request(method, self.api_base + path, json=data, headers=headers) as response:
+                if response.status == 429 and attempt == 0:
+                    retry_after = await self._retry_after(response)
+                    print(f"Rate limited on {method} {path}; retrying in {retry_after:.2f}s")
+                else:
+                    response.raise_for_status()
+                    if response.status == 204:
+                        return None
+                    return await response.json()
+
+            await asyncio.sleep(retry_after)
+
+    async def _retry_after(self, response: aiohttp.ClientResponse) -> float:
+        try:
+            retry_after = float((await response.json())["retry_after"])
+        except (aiohttp.ContentTypeError, ValueError, KeyError, TypeError):
+            retry_after = float(response.headers.get("Retry-After", 1))
+        return min(max(retry_after, 0), MAX_RETRY_AFTER)
+
+    async def edit_original(self, token: str, content: Optional[str]):
+        await self.api_request(
+            "PATCH", f"/webhooks/{self.application_id}/{token}/messages/@original", data={"content": content}
+        )
+
+    async def send_followup(self, token: str, content: Optional[str], ephemeral: bool = False):
+        await self.api_request(
+            "POST",
+            f"/webhooks/{self.application_id}/{token}",
+            data={"content": content, "flags": EPHEMERAL if ephemeral else 0},
+        )
+
+    def command_payloads(self) -> List[Dict[str, Any]]:
+        return [command.to_dict() for cog, command in self.commands.values()]
+
+    async def sync_commands(self):
+        """Register the cogs' slash commands with Discord over REST."""
+        if self.config.guild_id and not self.config.multi_tenant:
+            path = f"/applications/{self.application_id}/guilds/{self.config.guild_id}/commands"
+        else:
+            path = f"/applications/{self.application_id}/commands"
+
+        synced = await self.api_request("PUT", path, data=self.command_payloads(), auth=True)
+        print(f"Synced {len(synced)} command(s) via {path}.")
+
+
+def run_interactions_server(config: Config, sync_commands: bool = False):
+    server = InteractionsServer(config)
+    app = server.create_app()
+
+    if sync_commands:
+        async def _sync(app: web.Application):
+            await server.sync_commands()
+
+        # Runs after _on_startup, so the HTTP session is available.
+        app.on_startup.append(_sync)
+
+    print(f"Serving Discord interactions on http://{config.http_host}:{config.http_port}/interactions")
+    web.run_app(app, host=config.http_host, port=config.http_port, print=None)
@@ -0,0 +1,150 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from discord import Interaction
+
+from .admins import Admins
+from .backend.rcon import MinecraftRCONClient
+from .config import Config, TenantConfig, DEFAULT_TENANT_CACHE_SIZE, DEFAULT_TENANT_IDLE_SECONDS
+
+
+class Tenant:
+    """
+    The loaded state for one guild: its admin list and Minecraft RCON client.
+
+    Both are created lazily on first use.
+    """
+
+    def __init__(self, config: TenantConfig):
+        self.config = config
+        self.guild_id = config.guild_id
+        self._admins: Optional[Admins] = None
+        self._minecraft: Optional[MinecraftRCONClient] = None
+        self.last_used = time.monotonic()
+
+    @property
+    def admins(self) -> Admins:
+        """Get the tenant's admin list, loading it on first access."""
+        if self._admins is None:
+            self._admins = Admins(self.config.admins_yaml)
+        return self._admins
+
+    @property
+    def minecraft(self) -> MinecraftRCONClient:
+        """Get the tenant's RCON client, creating it on first access."""
+        if self._minecraft is None:
+            self._minecraft = MinecraftRCONClient(
+                self.config.rcon_host, self.config.rcon_port, self.config.rcon_password
+            )
+        return self._minecraft
+
+
+class TenantRegistry:
+    """
+    Maps Discord guilds to their tenants.
+
+    Tenants are loaded on demand and kept in an LRU cache; the least recently
+    used tenant is evicted when the cache is full, and tenants idle for longer
+    than idle_seconds are evicted on the next lookup.
+    """
+
+    def __init__(
+        self,
+        tenants: Dict[Optional[int], TenantConfig],
+        max_size: int = DEFAULT_TENANT_CACHE_SIZE,
+        idle_seconds: int = DEFAULT_TENANT_IDLE_SECONDS,
+    ):
+        """
+        Initializes the registry.
+
+        Args:
+            tenants: Tenant configurations keyed by guild ID. A None key serves every guild.
+            max_size: Maximum number of tenants kept loaded at once.
+            idle_seconds: Seconds of inactivity after which a tenant is evicted.
+        """
+        self.tenants = tenants
+        self.max_size = max(1, max_size)
+        self.idle_seconds = idle_seconds
+        self._loaded: "OrderedDict[Optional[int], Tenant]" = OrderedDict()
+
+    @classmethod
+    def from_config(cls, config: Config) -> "TenantRegistry":
+        """
+        Create a registry from the bot configuration, validating every tenant up front.
+
+        Raises:
+            ValueError: If a tenant is misconfigured.
+        """
+        tenants = config.tenants
+        admins_paths = {}
+        for guild_id, tenant_config in tenants.items():
+            name = "top-level configuration" if guild_id is None else f"tenant {guild_id}"
+            if not tenant_config.rcon_password:
+                raise ValueError(f"Required configuration key 'rcon_password' not found for {name}")
+
+            admins_path = os.path.abspath(tenant_config.admins_yaml)
+            if admins_path in admins_paths:
+                raise ValueError(f"{name} shares admins_yaml '{admins_path}' with {admins_paths[admins_path]}")
+            admins_paths[admins_path] = name
+
+        return cls(tenants, config.tenant_cache_size, config.tenant_idle_seconds)
+
+    def configured(self, guild_id: Optional[int]) -> Optional[TenantConfig]:
+        """Get the configuration serving the given guild, or None if it is not a tenant."""
+        if guild_id in self.tenants:
+            return self.tenants[guild_id]
+        return self.tenants.get(None)
+
+    def get(self, guild_id: Optional[int]) -> Optional[Tenant]:
+        """
+        Get the loaded tenant for a guild, loading it if necessary.
+
+        Returns:
+            The tenant, or None if the guild is not configured.
+        """
+        tenant_config = self.configured(guild_id)
+        if tenant_config is None:
+            return None
+
+        self._evict_idle()
+
+        key = tenant_config.guild_id
+        tenant = self._loaded.get(key)
+        if tenant is None:
+            tenant = Tenant(tenant_config)
+            self._loaded[key] = tenant
+            while len(self._loaded) > self.max_size:
+                evicted_key, _ = self._loaded.popitem(last=False)
+                print(f"Evicted tenant for guild {evicted_key} (cache full).")
+        else:
+            self._loaded.move_to_end(key)
+
+        tenant.last_used = time.monotonic()
+        return tenant
+
+    async def for_interaction(self, interaction: Interaction) -> Optional[Tenant]:
+        """
+        Look up the tenant serving the interaction's guild.
+
+        Also accepts the HTTP-mode stand-in, which provides the same guild_id/response surface.
+
+        Returns:
+            The tenant, or None if the guild is not configured (and sends a notice to the user)
+        """
+        tenant = self.get(interaction.guild_id)
+        if tenant is None:
+            print(f"No tenant configured for guild: {interaction.guild_id}")
+            await interaction.response.send_message("Minecord is not configured for this server.", ephemeral=True)
+        return tenant
+
+    def _evict_idle(self):
+        cutoff = time.monotonic() - self.idle_seconds
+        # The OrderedDict is kept in least-recently-used order, so stop at the first fresh tenant.
+        while self._loaded:
+            key, tenant = next(iter(self._loaded.items()))
+            if tenant.last_used >= cutoff:
+                break
+            del self._loaded[key]
+            print(f"Evicted tenant for guild {key} (idle).")